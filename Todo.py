@@ -1,9 +1,22 @@
+import atexit
+import heapq
 import json
 import os
+import re
+import stat
+import sys
+import tempfile
+from collections import Counter
 from datetime import datetime
 from enum import Enum
 
 FILE_NAME = "tasks.json"
+# fsync the new file before swapping it in; trades save latency for durability
+FSYNC_ON_SAVE = True
+
+# Cache of the parsed task list, keyed on the file's mtime. Changes are kept
+# here (marked dirty) until flush_if_dirty() writes them out.
+_cache = {"tasks": None, "mtime": None, "id_index": None, "sorted": None, "next_id": None, "dirty": False}
 
 class Priority(Enum):
     LOW = "🟢 Low"
@@ -15,24 +28,147 @@ class Status(Enum):
     COMPLETED = "✅ Completed"
     IN_PROGRESS = "🔄 In Progress"
 
+# Menu order for choices; built once instead of iterating the enums per prompt
+PRIORITIES = tuple(Priority)
+STATUSES = tuple(Status)
+
+# Display order for priorities: High -> Medium -> Low
+PRIORITY_ORDER = {Priority.HIGH.name: 0, Priority.MEDIUM.name: 1, Priority.LOW.name: 2}
+
+# Display labels keyed by the names stored in tasks.json
+PRIORITY_LABELS = {p.name: p.value for p in Priority}
+STATUS_LABELS = {s.name: s.value for s in Status}
+
+def _set_cache(tasks, mtime, dirty=False):
+    """Point the cache at a new task list and drop views derived from the old one."""
+    # The ID counter only moves forward, so keep it while the list is the same one
+    if tasks is not _cache["tasks"]:
+        _cache["next_id"] = None
+    _cache["tasks"] = tasks
+    _cache["mtime"] = mtime
+    _cache["dirty"] = dirty
+    _cache["id_index"] = None
+    _cache["sorted"] = None
+
+def _add_derived_keys(task):
+    """Cache derived lookup fields on the task; keys starting with "_" are never saved."""
+    task["_task_lc"] = task.get("task", "").lower()
+    task["_cat_lc"] = task.get("category", "General").lower()
+    task["_prio_rank"] = PRIORITY_ORDER.get(task.get("priority", Priority.MEDIUM.name), 1)
+
 def load_tasks():
-    """Load tasks from the JSON file with error handling."""
+    """Load tasks from the JSON file, reusing the cached list while the file is unchanged."""
+    # Unflushed changes are newer than anything on disk
+    if _cache["dirty"]:
+        return _cache["tasks"]
+    
     try:
         if os.path.exists(FILE_NAME):
+            mtime = os.stat(FILE_NAME).st_mtime_ns
+            if _cache["tasks"] is not None and _cache["mtime"] == mtime:
+                return _cache["tasks"]
             with open(FILE_NAME, "r", encoding="utf-8") as file:
-                return json.load(file)
+                tasks = json.load(file)
+            for task in tasks:
+                # Share one string object per distinct value across all tasks
+                for key in ("priority", "status", "category"):
+                    if isinstance(task.get(key), str):
+                        task[key] = sys.intern(task[key])
+                _add_derived_keys(task)
+            _set_cache(tasks, mtime)
+            return tasks
     except (json.JSONDecodeError, FileNotFoundError) as e:
         print(f"⚠️ Error loading tasks: {e}")
         print("📝 Starting with empty task list.")
     return []
 
 def save_tasks(tasks):
-    """Save tasks to the JSON file with error handling."""
+    """Store tasks as the current list; the file is written on the next flush_if_dirty()."""
+    _set_cache(tasks, _cache["mtime"], dirty=True)
+
+def flush_if_dirty():
+    """Write pending changes to the JSON file with error handling."""
+    if not _cache["dirty"]:
+        return
+    
+    tmp_name = None
     try:
-        with open(FILE_NAME, "w", encoding="utf-8") as file:
-            json.dump(tasks, file, indent=4, ensure_ascii=False)
+        # Strip in-memory helper keys so they are not persisted
+        stored = [{k: v for k, v in task.items() if not k.startswith("_")} for task in _cache["tasks"]]
+        
+        # Write to a unique temp file beside the real one, then swap it in,
+        # so a crash mid-write never truncates the old file
+        dir_name = os.path.dirname(os.path.abspath(FILE_NAME))
+        fd, tmp_name = tempfile.mkstemp(prefix=".tasks.", suffix=".json", dir=dir_name)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(stored, file, ensure_ascii=False, separators=(",", ":"))
+            if FSYNC_ON_SAVE:
+                file.flush()
+                os.fsync(file.fileno())
+        # mkstemp creates the file owner-only; match what open() would have given
+        if os.path.exists(FILE_NAME):
+            mode = stat.S_IMODE(os.stat(FILE_NAME).st_mode)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, FILE_NAME)
+        tmp_name = None
+        
+        _cache["mtime"] = os.stat(FILE_NAME).st_mtime_ns
+        _cache["dirty"] = False
     except Exception as e:
         print(f"❌ Error saving tasks: {e}")
+    finally:
+        if tmp_name is not None and os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+atexit.register(flush_if_dirty)
+
+def _index_by_id(tasks):
+    """Map each task ID to its position in the list (first occurrence wins).
+
+    The index for the cached list is built once and reused until the next load or save.
+    """
+    cached = tasks is _cache["tasks"]
+    if cached and _cache["id_index"] is not None:
+        return _cache["id_index"]
+    
+    id_index = {}
+    for i, task in enumerate(tasks):
+        id_index.setdefault(task.get("id"), i)
+    if cached:
+        _cache["id_index"] = id_index
+    return id_index
+
+def _sort_key(task):
+    """Sort key for listings: priority (High first), then creation date."""
+    return (task["_prio_rank"], task.get("created", ""))
+
+def _sorted_tasks(tasks):
+    """Return tasks ordered by priority and creation date.
+
+    The sorted view of the cached list is reused until the next load or save.
+    """
+    cached = tasks is _cache["tasks"]
+    if cached and _cache["sorted"] is not None:
+        return _cache["sorted"]
+    
+    ordered = sorted(tasks, key=_sort_key)
+    if cached:
+        _cache["sorted"] = ordered
+    return ordered
+
+def _allocate_id(tasks):
+    """Return a new task ID, one past the highest ID handed out for this list."""
+    cached = tasks is _cache["tasks"]
+    next_id = _cache["next_id"] if cached else None
+    if next_id is None:
+        next_id = max((t.get("id", 0) for t in tasks), default=0) + 1
+    if cached:
+        _cache["next_id"] = next_id + 1
+    return next_id
 
 def add_task():
     """Add a new task with enhanced features."""
@@ -44,12 +180,12 @@ def add_task():
         return
     
     print("\nSelect Priority:")
-    for i, priority in enumerate(Priority, 1):
+    for i, priority in enumerate(PRIORITIES, 1):
         print(f"{i}. {priority.value}")
     
     try:
         priority_choice = int(input("Enter priority (1-3, default: 2): ") or "2")
-        priority = list(Priority)[priority_choice - 1]
+        priority = PRIORITIES[priority_choice - 1]
     except (ValueError, IndexError):
         priority = Priority.MEDIUM
         print(f"⚠️ Invalid choice, using default: {priority.value}")
@@ -66,8 +202,9 @@ def add_task():
             print("⚠️ Invalid date format, ignoring due date.")
             due_date = None
     
+    tasks = load_tasks()
     task_data = {
-        "id": len(load_tasks()) + 1,
+        "id": _allocate_id(tasks),
         "task": task_text,
         "priority": priority.name,
         "status": Status.PENDING.name,
@@ -76,64 +213,76 @@ def add_task():
         "due_date": due_date,
         "completed_date": None
     }
+    _add_derived_keys(task_data)
     
-    tasks = load_tasks()
     tasks.append(task_data)
     save_tasks(tasks)
     print(f"✅ Task added successfully: {task_text}")
 
-def list_tasks(filter_status=None, filter_category=None):
-    """List tasks with optional filtering and enhanced display."""
-    tasks = load_tasks()
+def list_tasks(filter_status=None, filter_category=None, tasks=None, limit=None):
+    """List tasks with optional filtering and enhanced display.
+
+    With a limit, only the first ``limit`` tasks in priority order are shown.
+    """
+    if tasks is None:
+        tasks = load_tasks()
     
-    if filter_status:
-        tasks = [t for t in tasks if t.get("status") == filter_status]
-    if filter_category:
-        tasks = [t for t in tasks if t.get("category", "").lower() == filter_category.lower()]
+    # Sort by priority (High -> Medium -> Low) and then by creation date.
+    # A full listing filters the cached sorted view, which keeps its order.
+    if limit is None:
+        tasks = _sorted_tasks(tasks)
+    
+    # Apply both filters in a single pass
+    if filter_status or filter_category:
+        if filter_category:
+            filter_category = filter_category.lower()
+        tasks = [t for t in tasks
+                 if (not filter_status or t.get("status") == filter_status)
+                 and (not filter_category or t["_cat_lc"] == filter_category)]
+    
+    # A limited listing only needs the top rows, so select them with a heap
+    if limit is not None:
+        tasks = heapq.nsmallest(limit, tasks, key=_sort_key)
     
     if not tasks:
         print("📭 No tasks found.")
         return
     
-    print(f"\n📌 Tasks Found: {len(tasks)}")
-    print("=" * 80)
-    
-    # Sort by priority (High -> Medium -> Low) and then by creation date
-    priority_order = {Priority.HIGH.name: 0, Priority.MEDIUM.name: 1, Priority.LOW.name: 2}
-    tasks.sort(key=lambda x: (priority_order.get(x.get("priority", Priority.MEDIUM.name), 1), x.get("created", "")))
+    # Build the whole listing and print it in one call
+    lines = [f"\n📌 Tasks Found: {len(tasks)}", "=" * 80]
+    default_priority = Priority.MEDIUM.value
+    default_status = Status.PENDING.value
     
     for i, task in enumerate(tasks, 1):
-        priority = Priority[task.get("priority", "MEDIUM")].value
-        status = Status[task.get("status", "PENDING")].value
+        # Read each field once per row
+        priority = PRIORITY_LABELS.get(task.get("priority"), default_priority)
+        status = STATUS_LABELS.get(task.get("status"), default_status)
         category = task.get("category", "General")
         created = task.get("created", "Unknown")
         due_date = task.get("due_date", "No due date")
+        completed_date = task.get("completed_date")
         
-        print(f"{i:2d}. [{task.get('id', i):2d}] {priority} | {status}")
-        print(f"    📝 {task['task']}")
-        print(f"    🏷️  Category: {category} | 📅 Created: {created[:10]}")
+        lines.append(f"{i:2d}. [{task.get('id', i):2d}] {priority} | {status}")
+        lines.append(f"    📝 {task['task']}")
+        lines.append(f"    🏷️  Category: {category} | 📅 Created: {created[:10]}")
         if due_date != "No due date":
-            print(f"    ⏰ Due: {due_date}")
+            lines.append(f"    ⏰ Due: {due_date}")
         
-        if task.get("completed_date"):
-            print(f"    ✅ Completed: {task['completed_date']}")
-        print()
+        if completed_date:
+            lines.append(f"    ✅ Completed: {completed_date}")
+        lines.append("")
+    
+    print("\n".join(lines))
 
-def remove_task():
+def remove_task(tasks):
     """Remove a task by ID."""
-    list_tasks()
-    if not load_tasks():
+    list_tasks(tasks=tasks)
+    if not tasks:
         return
     
     try:
         task_id = int(input("Enter task ID to remove: "))
-        tasks = load_tasks()
-        
-        task_to_remove = None
-        for i, task in enumerate(tasks):
-            if task.get("id") == task_id:
-                task_to_remove = i
-                break
+        task_to_remove = _index_by_id(tasks).get(task_id)
         
         if task_to_remove is not None:
             removed = tasks.pop(task_to_remove)
@@ -145,32 +294,26 @@ def remove_task():
     except ValueError:
         print("⚠️ Please enter a valid task ID.")
 
-def update_task_status():
+def update_task_status(tasks):
     """Update task status."""
-    list_tasks()
-    if not load_tasks():
+    list_tasks(tasks=tasks)
+    if not tasks:
         return
     
     try:
         task_id = int(input("Enter task ID to update: "))
-        tasks = load_tasks()
-        
-        task_index = None
-        for i, task in enumerate(tasks):
-            if task.get("id") == task_id:
-                task_index = i
-                break
+        task_index = _index_by_id(tasks).get(task_id)
         
         if task_index is None:
             print("⚠️ Task not found.")
             return
         
         print("\nSelect new status:")
-        for i, status in enumerate(Status, 1):
+        for i, status in enumerate(STATUSES, 1):
             print(f"{i}. {status.value}")
         
         status_choice = int(input("Enter status (1-3): "))
-        new_status = list(Status)[status_choice - 1]
+        new_status = STATUSES[status_choice - 1]
         
         tasks[task_index]["status"] = new_status.name
         
@@ -185,21 +328,15 @@ def update_task_status():
     except (ValueError, IndexError):
         print("⚠️ Invalid input.")
 
-def edit_task():
+def edit_task(tasks):
     """Edit an existing task."""
-    list_tasks()
-    if not load_tasks():
+    list_tasks(tasks=tasks)
+    if not tasks:
         return
     
     try:
         task_id = int(input("Enter task ID to edit: "))
-        tasks = load_tasks()
-        
-        task_index = None
-        for i, task in enumerate(tasks):
-            if task.get("id") == task_id:
-                task_index = i
-                break
+        task_index = _index_by_id(tasks).get(task_id)
         
         if task_index is None:
             print("⚠️ Task not found.")
@@ -213,14 +350,14 @@ def edit_task():
             tasks[task_index]["task"] = new_description
         
         print("\nSelect new priority:")
-        for i, priority in enumerate(Priority, 1):
+        for i, priority in enumerate(PRIORITIES, 1):
             print(f"{i}. {priority.value}")
         
         priority_input = input("Enter priority (1-3, press Enter to keep current): ").strip()
         if priority_input:
             try:
                 priority_choice = int(priority_input)
-                new_priority = list(Priority)[priority_choice - 1]
+                new_priority = PRIORITIES[priority_choice - 1]
                 tasks[task_index]["priority"] = new_priority.name
             except (ValueError, IndexError):
                 print("⚠️ Invalid priority, keeping current.")
@@ -229,6 +366,7 @@ def edit_task():
         if new_category:
             tasks[task_index]["category"] = new_category
         
+        _add_derived_keys(tasks[task_index])
         save_tasks(tasks)
         print("✅ Task updated successfully!")
         
@@ -236,34 +374,37 @@ def edit_task():
         print("⚠️ Please enter a valid task ID.")
 
 def search_tasks():
-    """Search tasks by keyword."""
-    keyword = input("Enter search keyword: ").strip().lower()
-    if not keyword:
+    """Search tasks by one or more comma-separated keywords."""
+    raw = input("Enter search keyword(s), separated by commas: ").strip().lower()
+    keywords = [k.strip() for k in raw.split(",") if k.strip()]
+    if not keywords:
         print("⚠️ Please enter a search keyword.")
         return
+    keyword = ", ".join(keywords)
     
-    tasks = load_tasks()
-    matching_tasks = []
+    # A single compiled alternation scans each field once for all keywords
+    pattern = re.compile("|".join(map(re.escape, keywords)))
     
-    for task in tasks:
-        if (keyword in task.get("task", "").lower() or 
-            keyword in task.get("category", "").lower()):
-            matching_tasks.append(task)
+    tasks = load_tasks()
+    matching_tasks = [t for t in tasks if pattern.search(t["_task_lc"]) or pattern.search(t["_cat_lc"])]
     
     if not matching_tasks:
         print(f"🔍 No tasks found containing '{keyword}'")
         return
     
-    print(f"\n🔍 Search Results for '{keyword}': {len(matching_tasks)} tasks")
-    print("=" * 80)
+    lines = [f"\n🔍 Search Results for '{keyword}': {len(matching_tasks)} tasks", "=" * 80]
+    default_priority = Priority.MEDIUM.value
+    default_status = Status.PENDING.value
     
     for i, task in enumerate(matching_tasks, 1):
-        priority = Priority[task.get("priority", "MEDIUM")].value
-        status = Status[task.get("status", "PENDING")].value
-        print(f"{i}. [{task.get('id'):2d}] {priority} | {status}")
-        print(f"   📝 {task['task']}")
-        print(f"   🏷️ Category: {task.get('category', 'General')}")
-        print()
+        priority = PRIORITY_LABELS.get(task.get("priority"), default_priority)
+        status = STATUS_LABELS.get(task.get("status"), default_status)
+        lines.append(f"{i}. [{task.get('id'):2d}] {priority} | {status}")
+        lines.append(f"   📝 {task['task']}")
+        lines.append(f"   🏷️ Category: {task.get('category', 'General')}")
+        lines.append("")
+    
+    print("\n".join(lines))
 
 def show_statistics():
     """Show task statistics."""
@@ -272,37 +413,42 @@ def show_statistics():
         print("📭 No tasks to analyze.")
         return
     
+    # Tally status, priority and category in a single pass
+    status_counts = Counter()
+    priority_counts = Counter()
+    categories = Counter()
+    for task in tasks:
+        status_counts[task.get("status")] += 1
+        priority_counts[task.get("priority")] += 1
+        categories[task.get("category", "General")] += 1
+    
     total = len(tasks)
-    completed = len([t for t in tasks if t.get("status") == Status.COMPLETED.name])
-    pending = len([t for t in tasks if t.get("status") == Status.PENDING.name])
-    in_progress = len([t for t in tasks if t.get("status") == Status.IN_PROGRESS.name])
+    completed = status_counts[Status.COMPLETED.name]
+    pending = status_counts[Status.PENDING.name]
+    in_progress = status_counts[Status.IN_PROGRESS.name]
     
     # Priority breakdown
-    high_priority = len([t for t in tasks if t.get("priority") == Priority.HIGH.name])
-    medium_priority = len([t for t in tasks if t.get("priority") == Priority.MEDIUM.name])
-    low_priority = len([t for t in tasks if t.get("priority") == Priority.LOW.name])
+    high_priority = priority_counts[Priority.HIGH.name]
+    medium_priority = priority_counts[Priority.MEDIUM.name]
+    low_priority = priority_counts[Priority.LOW.name]
     
-    # Category breakdown
-    categories = {}
-    for task in tasks:
-        cat = task.get("category", "General")
-        categories[cat] = categories.get(cat, 0) + 1
-    
-    print("\n📊 Task Statistics")
-    print("=" * 40)
-    print(f"📝 Total Tasks: {total}")
-    print(f"✅ Completed: {completed} ({completed/total*100:.1f}%)")
-    print(f"⏳ Pending: {pending} ({pending/total*100:.1f}%)")
-    print(f"🔄 In Progress: {in_progress} ({in_progress/total*100:.1f}%)")
-    print()
-    print("🎯 Priority Breakdown:")
-    print(f"   🔴 High: {high_priority}")
-    print(f"   🟡 Medium: {medium_priority}")
-    print(f"   🟢 Low: {low_priority}")
-    print()
-    print("🏷️ Categories:")
-    for cat, count in sorted(categories.items()):
-        print(f"   {cat}: {count}")
+    lines = [
+        "\n📊 Task Statistics",
+        "=" * 40,
+        f"📝 Total Tasks: {total}",
+        f"✅ Completed: {completed} ({completed/total*100:.1f}%)",
+        f"⏳ Pending: {pending} ({pending/total*100:.1f}%)",
+        f"🔄 In Progress: {in_progress} ({in_progress/total*100:.1f}%)",
+        "",
+        "🎯 Priority Breakdown:",
+        f"   🔴 High: {high_priority}",
+        f"   🟡 Medium: {medium_priority}",
+        f"   🟢 Low: {low_priority}",
+        "",
+        "🏷️ Categories:",
+    ]
+    lines.extend(f"   {cat}: {count}" for cat, count in sorted(categories.items()))
+    print("\n".join(lines))
 
 def filter_menu():
     """Show filtering options."""
@@ -319,11 +465,11 @@ def filter_menu():
             list_tasks()
         elif choice == "2":
             print("\nSelect status to filter:")
-            for i, status in enumerate(Status, 1):
+            for i, status in enumerate(STATUSES, 1):
                 print(f"{i}. {status.value}")
             try:
                 status_choice = int(input("Enter choice (1-3): "))
-                filter_status = list(Status)[status_choice - 1].name
+                filter_status = STATUSES[status_choice - 1].name
                 list_tasks(filter_status=filter_status)
             except (ValueError, IndexError):
                 print("⚠️ Invalid choice.")
@@ -354,9 +500,10 @@ def main():
         print("6. 🔄 Update task status")
         print("7. ❌ Remove task")
         print("8. 📊 Show statistics")
-        print("9. 🚪 Exit")
+        print("9. 🔥 Show top 10 urgent tasks")
+        print("10. 🚪 Exit")
         
-        choice = input("\nEnter your choice (1-9): ").strip()
+        choice = input("\nEnter your choice (1-10): ").strip()
         
         if choice == "1":
             add_task()
@@ -367,20 +514,24 @@ def main():
         elif choice == "4":
             search_tasks()
         elif choice == "5":
-            edit_task()
+            edit_task(load_tasks())
         elif choice == "6":
-            update_task_status()
+            update_task_status(load_tasks())
         elif choice == "7":
-            remove_task()
+            remove_task(load_tasks())
         elif choice == "8":
             show_statistics()
         elif choice == "9":
+            list_tasks(limit=10)
+        elif choice == "10":
             print("👋 Thank you for using Enhanced Todo List Manager!")
             print("🎯 Stay productive!")
             break
         else:
             print("⚠️ Invalid choice, please try again.")
         
+        flush_if_dirty()
+        
         # Pause before showing menu again
         input("\nPress Enter to continue...")
 